@@ -0,0 +1,103 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+import FinanceDataReader as fdr
+
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+KST = timezone(timedelta(hours=9))
+DATA_SETTLED_HOUR = 16  # 장 마감(15:30) 후 당일 시세가 확정되었다고 보는 시각 (KST)
+
+
+def last_market_close(now: datetime = None) -> datetime:
+    """가장 최근에 당일 시세가 확정된 시각 (주말은 직전 금요일, 공휴일은 고려하지 않음)"""
+    now = now or datetime.now(KST)
+    settled = now.replace(hour=DATA_SETTLED_HOUR, minute=0, second=0, microsecond=0)
+    if now < settled:
+        settled -= timedelta(days=1)
+    while settled.weekday() >= 5:
+        settled -= timedelta(days=1)
+    return settled
+
+
+class FileCache:
+    """pickle 기반 파일 캐시
+
+    max_age_days를 주지 않으면 마지막 장 마감 이전에 저장된 항목을 만료시켜
+    장중에 저장된 미완성 일봉이 마감 후 실행에서 재사용되지 않도록 함.
+    과거 일자처럼 바뀌지 않는 데이터는 max_age_days로 보관 기간만 지정.
+    """
+
+    def __init__(self, directory, max_age_days: float = None):
+        self.directory = Path(directory)
+        self.max_age_days = max_age_days
+        self._pruned = False
+
+    def _expiry_cutoff(self) -> float:
+        if self.max_age_days is None:
+            return last_market_close().timestamp()
+        return time.time() - self.max_age_days * 86400
+
+    def _path(self, key: tuple) -> Path:
+        # 파일명 길이를 제한하기 위해 키 전체는 해시로 대체
+        digest = hashlib.md5("|".join(map(str, key)).encode()).hexdigest()[:16]
+        return self.directory / f"{key[0]}_{digest}.pkl"
+
+    def prune(self):
+        """만료된 캐시 파일 삭제 (키에 날짜가 들어가므로 지우지 않으면 계속 쌓임)"""
+        cutoff = self._expiry_cutoff()
+        for path in self.directory.glob('*'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def get(self, key: tuple):
+        path = self._path(key)
+        try:
+            if path.stat().st_mtime < self._expiry_cutoff():
+                path.unlink()
+                return None
+            return pd.read_pickle(path)
+        except Exception:
+            return None
+
+    def set(self, key: tuple, value):
+        path = self._path(key)
+        # 여러 스레드가 같은 키를 동시에 쓰더라도 깨진 파일이 남지 않도록 임시 파일 후 교체
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        # 디렉터리 전체를 훑는 정리는 프로세스당 한 번만
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 캐시 저장 실패: {e}")
+
+
+ohlcv_cache = FileCache(CACHE_DIR / 'ohlcv')
+
+
+def cached_datareader(code: str, start: str, end: str = None) -> pd.DataFrame:
+    """fdr.DataReader 결과를 (종목코드, 시작일, 종료일) 기준으로 캐시"""
+    if end is None:
+        end = datetime.today().strftime('%Y-%m-%d')
+
+    key = (code, start, end)
+    df = ohlcv_cache.get(key)
+    if df is None:
+        df = fdr.DataReader(code, start=start, end=end)
+        ohlcv_cache.set(key, df)
+    return df
@@ -0,0 +1,81 @@
+import os
+from datetime import datetime
+from functools import lru_cache
+
+import requests
+import pandas as pd
+import FinanceDataReader as fdr
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cache import CACHE_DIR, KST, FileCache
+
+DISCORD_MAX_EMBEDS = 10  # 메시지 하나에 담을 수 있는 embed 최대 개수
+
+# fdr는 내부에서 requests.get/post를 직접 호출하므로 keep-alive 세션으로 교체해
+# 매 요청마다 TLS 연결을 새로 맺지 않도록 함 (디스코드 웹훅 전송도 같은 세션 사용)
+# pykrx는 자체 세션(KRXSession)으로 요청하므로 이 교체의 영향을 받지 않음
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=50, pool_maxsize=50, max_retries=Retry(total=3, backoff_factor=0.2)
+))
+requests.get = _session.get
+requests.post = _session.post
+
+listing_cache = FileCache(CACHE_DIR / 'stock_list')
+
+
+@lru_cache(maxsize=1)
+def _cached_listings(date_key: str) -> pd.DataFrame:
+    df = listing_cache.get((date_key,))
+    if df is None:
+        kospi = fdr.StockListing('KOSPI')
+        kosdaq = fdr.StockListing('KOSDAQ')
+        df = pd.concat([kospi, kosdaq], ignore_index=True)
+        listing_cache.set((date_key,), df)
+    return df
+
+
+def get_stock_list() -> pd.DataFrame:
+    """코스피 + 코스닥 종목 목록 (하루 단위로 캐시)"""
+    date_key = datetime.now(KST).strftime('%Y%m%d')
+    return _cached_listings(date_key)
+
+
+def send_discord_webhook(reports: list, webhook_url: str = None):
+    """디스코드 웹훅으로 결과 전송 (전략별 결과를 embed로 묶어 한 번에 전송)
+
+    reports: [{'title', 'description', 'color', 'matched'}, ...]
+    """
+    if not webhook_url:
+        webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+    
+    if not webhook_url:
+        print("⚠️ 디스코드 웹훅 URL이 설정되지 않았습니다.")
+        return
+    
+    embeds = []
+    for report in reports[:DISCORD_MAX_EMBEDS]:
+        filter_desc = report['description']
+        matched_stocks = report['matched']
+        if not matched_stocks:
+            message = f"{filter_desc}\n❌ 조건에 맞는 종목이 없습니다."
+        else:
+            stocks_text = "\n".join([
+                f"• {name} ({code}) - {close:,.0f}원" for name, code, close in matched_stocks
+            ])
+            message = f"{filter_desc}\n✅ **조건 만족 종목 ({len(matched_stocks)}개)**\n\n{stocks_text}"
+        embeds.append({'title': report['title'], 'description': message, 'color': report['color']})
+    
+    # 현재 시간 추가
+    current_time = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+    
+    try:
+        payload = {"content": f"⏰ **실행 시간**: {current_time} (KST)", "embeds": embeds}
+        response = requests.post(webhook_url, json=payload, timeout=10)
+        if response.status_code == 204:
+            print("✅ 디스코드로 결과가 전송되었습니다.")
+        else:
+            print(f"❌ 디스코드 전송 실패: {response.status_code}")
+    except Exception as e:
+        print(f"❌ 디스코드 전송 오류: {e}")
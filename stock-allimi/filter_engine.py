@@ -0,0 +1,145 @@
+import os
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+
+import bottleneck as bn
+import numpy as np
+
+from common import get_stock_list
+from kernels import ichimoku_cloud_at
+from krx import get_volume_stats
+from naver import fetch_ohlcv_many
+
+
+def check_ichimoku_below_cloud(ohlcv: dict) -> bool:
+    """거래량 + 골든크로스 + 일목균형표 음구름 아래 조건"""
+    if len(ohlcv['Close']) < 78:  # 일목균형표 계산을 위해 충분한 데이터 필요 (52 + 26)
+        return False
+
+    # 조건은 계산 비용이 적은 순서(거래량 → 골든크로스 → 일목균형표)로 확인
+    # 1) 거래량 조건: 3개월 평균 거래량 < 100만이면서 3개월 내 100만 이상 한 번 이상
+    three_month_volume = ohlcv['Volume'][-90:]
+    three_month_avg = three_month_volume.mean()  # 3개월 평균
+    three_month_max = three_month_volume.max()   # 3개월 최대
+    
+    if three_month_avg >= 1_000_000:  # 3개월 평균이 100만 이상이면 제외
+        return False
+    if three_month_max < 1_000_000:   # 3개월 내 100만 이상이 없으면 제외
+        return False
+
+    # 2) 5일선이 20일선 돌파 (골든크로스) - 최근 7일 내 돌파
+    # 최근 7일치 이동평균만 필요하므로 5일선은 종가 끝 11개(5 + 6), 20일선은 끝 26개(20 + 6)만 사용
+    # 20일 합계는 float32 정밀도를 넘을 수 있으므로 합산은 float64로
+    closes = ohlcv['Close'][-26:].astype(np.float64)
+    # bottleneck의 move_mean은 누적합 기반 O(n) C 구현 (앞쪽 window - 1개는 NaN이라 제외)
+    ma5 = bn.move_mean(closes[-11:], 5)[4:]
+    ma20 = bn.move_mean(closes, 20)[19:]
+
+    # 최근 7일 내에 골든크로스가 발생했는지 확인
+    golden_cross_found = bool(np.any((ma5[:-1] <= ma20[:-1]) & (ma5[1:] > ma20[1:])))
+    
+    if not golden_cross_found:
+        return False
+
+    # 3) 일목균형표 조건: 현재 주가가 음구름(파란색구름대) 아래에 있는지
+    current_price = ohlcv['Close'][-1]
+    
+    # 현재 시점의 구름대: 26일 전에 계산된 선행스팬 값들
+    span1_current, span2_current = ichimoku_cloud_at(ohlcv['High'], ohlcv['Low'])
+    
+    # NaN 값 체크
+    if np.isnan(span1_current) or np.isnan(span2_current):
+        return False
+    
+    # 구름대 판단: 선행스팬1 < 선행스팬2이면 음구름(파란색)
+    is_negative_cloud = span1_current < span2_current
+    
+    if not is_negative_cloud:
+        return False
+    
+    # 현재 주가가 구름대 아래에 있는지 확인 (음구름이므로 구름 하단은 선행스팬1)
+    cloud_bottom = span1_current
+    
+    if current_price >= cloud_bottom:
+        return False
+
+    return True
+
+
+# 전략 이름 -> 조건 함수와 디스코드 embed에 표시할 제목, 색상, 필터링 조건 요약
+STRATEGIES = {
+    'ichimoku_below_cloud': {
+        'check': check_ichimoku_below_cloud,
+        'title': "☁️ 일목균형표 음구름 아래",
+        'color': 0x3498DB,  # 파랑 (음구름)
+        'description': (
+            "📊 [필터링 조건]\n"
+            "- 3개월 평균 거래량 < 100만, 3개월 내 100만 이상 1회\n"
+            "- 최근 7일 내 5일선이 20일선 돌파\n"
+            "- 현재 주가가 일목균형표 음구름(파랑) 아래\n"
+        ),
+    },
+}
+
+
+def analyze_stock(stock_info: tuple, ohlcv: dict) -> dict:
+    """개별 종목 분석 함수 (전략 이름 -> 조건 만족 시 (이름, 코드, 종가), 아니면 None)"""
+    code, name = stock_info
+    results = dict.fromkeys(STRATEGIES)
+
+    # 한 번 가져온 데이터에 모든 전략을 적용
+    for strategy_name, strategy in STRATEGIES.items():
+        try:
+            if strategy['check'](ohlcv):
+                close = float(ohlcv['Close'][-1])
+                print(f"✅ 조건 만족 [{strategy_name}]: {name} ({code})")
+                results[strategy_name] = (name, code, close)
+        except Exception as e:
+            # 프로세스 풀 워커 안에서 실행되므로 여기서 출력하지 않으면 오류가 드러나지 않음
+            print(f"⚠️ 전략 실행 오류 [{strategy_name}]: {name} ({code}) - {e}")
+
+    return results
+
+
+def run_filter() -> dict:
+    """모든 전략을 한 번의 조회로 실행 (전략 이름 -> 조건 만족 종목 목록)"""
+    stock_list = get_stock_list()
+    matched_stocks = {strategy_name: [] for strategy_name in STRATEGIES}
+
+    # 종목 정보를 (코드, 이름) 튜플로 변환
+    stock_infos = list(zip(stock_list['Code'].to_numpy(), stock_list['Name'].to_numpy()))
+
+    # 어제 날짜를 기준으로 데이터 가져오기 (일목균형표 계산을 위해 120일)
+    # 기준 시각은 한 번만 구해 모든 종목과 캐시 키가 같은 기간을 쓰도록 함
+    today = datetime.today()
+    yesterday = today - timedelta(days=1)
+    start = (yesterday - timedelta(days=120)).strftime('%Y-%m-%d')
+    end = today.strftime('%Y-%m-%d')
+
+    # 전 종목 일자별 시세로 거래량 조건을 먼저 걸러 개별 조회 대상을 줄임
+    # (현재 등록된 전략은 모두 같은 거래량 조건을 사용)
+    # 스냅샷에 없는 종목은 판단할 수 없으므로 제외하지 않고 개별 조회로 넘김
+    try:
+        volume_stats = get_volume_stats(start, end)
+        failed = set(volume_stats.index[
+            (volume_stats['mean'] >= 1_000_000) | (volume_stats['max'] < 1_000_000)
+        ])
+        stock_infos = [stock_info for stock_info in stock_infos if stock_info[0] not in failed]
+    except Exception as e:
+        print(f"⚠️ 일자별 시세 조회 실패, 전 종목을 개별 조회합니다: {e}")
+
+    # 네트워크 조회는 비동기로 한 번에 처리
+    data = fetch_ohlcv_many([code for code, _ in stock_infos], start, end)
+
+    # 프로세스 간에는 pandas 대신 작은 numpy 배열만 넘김
+    analysis_infos = [stock_info for stock_info in stock_infos if stock_info[0] in data]
+    analysis_arrays = [data[code] for code, _ in analysis_infos]
+
+    # 분석은 CPU 작업이므로 GIL을 피해 코어 수만큼 프로세스로 병렬 처리
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for results in executor.map(analyze_stock, analysis_infos, analysis_arrays, chunksize=32):
+            for strategy_name, result in results.items():
+                if result:
+                    matched_stocks[strategy_name].append(result)
+
+    return matched_stocks
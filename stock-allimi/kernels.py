@@ -0,0 +1,40 @@
+import numpy as np
+from numba import njit
+
+# 일목균형표 기준 설정
+CONVERSION_PERIOD = 9      # 전환기간
+BASE_PERIOD = 26           # 기준기간
+LEADING_SPAN2_PERIOD = 52  # 선행2기간
+DISPLACEMENT = 26          # 선행 이동값
+
+
+@njit(cache=True)
+def ichimoku_cloud_at(high: np.ndarray, low: np.ndarray, displacement: int = DISPLACEMENT):
+    """현재 시점의 구름대 (선행스팬1, 선행스팬2) 계산
+
+    선행스팬은 displacement일 전 봉에서 계산된 값이므로 그 봉 하나에 대해서만
+    52일 구간을 거꾸로 한 번 훑으면서 9/26/52일 최고가·최저가를 함께 구한다.
+    """
+    end = len(high) - displacement
+    if end < LEADING_SPAN2_PERIOD - 1:
+        return np.nan, np.nan
+
+    highest = -np.inf
+    lowest = np.inf
+    conversion_line = np.nan
+    base_line = np.nan
+    for k in range(LEADING_SPAN2_PERIOD):
+        if high[end - k] > highest:
+            highest = high[end - k]
+        if low[end - k] < lowest:
+            lowest = low[end - k]
+
+        if k == CONVERSION_PERIOD - 1:
+            # 전환선 (9일 최고가 + 최저가) / 2
+            conversion_line = (highest + lowest) / 2
+        elif k == BASE_PERIOD - 1:
+            # 기준선 (26일 최고가 + 최저가) / 2
+            base_line = (highest + lowest) / 2
+
+    # 선행스팬1 = (전환선 + 기준선) / 2, 선행스팬2 = (52일 최고가 + 최저가) / 2
+    return (conversion_line + base_line) / 2, (highest + lowest) / 2
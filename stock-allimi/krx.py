@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+from cache import CACHE_DIR, KST, FileCache
+
+# 지난 일자의 스냅샷은 바뀌지 않으므로 분석 기간(120일)보다 넉넉히 보관
+snapshot_cache = FileCache(CACHE_DIR / 'snapshot', max_age_days=200)
+
+
+def has_krx_credentials() -> bool:
+    """KRX 데이터 조회에 필요한 로그인 정보(KRX_ID, KRX_PW 환경 변수)가 있는지"""
+    return bool(os.getenv('KRX_ID') and os.getenv('KRX_PW'))
+
+
+def get_daily_snapshot(date: str) -> pd.DataFrame:
+    """특정 일자의 전 종목 시세 (KRX 일별 스냅샷)"""
+    df = snapshot_cache.get((date,))
+    if df is None:
+        # pykrx(1.2.5+)는 import 시점에 KRX 로그인을 시도하므로 실제로 필요할 때만 import
+        from pykrx.stock import get_market_ohlcv
+
+        df = get_market_ohlcv(date, market='ALL')
+        # pykrx는 조회 실패 시 예외 대신 빈 DataFrame을 돌려주므로 캐시하지 않고 실패로 처리
+        if df.empty:
+            raise ValueError(f"{date} 일자 스냅샷이 비어 있습니다.")
+        # 당일 스냅샷은 KRX 공시 전에는 0으로 채워져 내려오므로 지난 일자만 캐시
+        if date < datetime.now(KST).strftime('%Y%m%d'):
+            snapshot_cache.set((date,), df)
+    return df
+
+
+def get_volume_stats(start: str, end: str) -> pd.DataFrame:
+    """일자별 스냅샷을 모아 종목별 3개월 거래량 평균/최대를 한 번에 계산"""
+    # 로그인 정보 없이는 모든 요청이 빈 결과로 돌아오므로 조회 자체를 건너뜀
+    if not has_krx_credentials():
+        raise RuntimeError("KRX_ID/KRX_PW 환경 변수가 설정되지 않았습니다.")
+
+    dates = pd.bdate_range(start, end).strftime('%Y%m%d')
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        snapshots = list(executor.map(get_daily_snapshot, dates))
+
+    # 휴장일은 시세·거래량이 모두 0인 행으로 내려오므로 제외
+    frames = {
+        date: snapshot.rename(columns={'거래량': 'Volume'})[['Volume']]
+        for date, snapshot in zip(dates, snapshots)
+        if (snapshot['거래량'] > 0).any() and (snapshot['종가'] > 0).any()
+    }
+    volume = pd.concat(frames).rename_axis(['Date', 'Ticker'])['Volume']
+
+    return volume.groupby(level='Ticker').tail(90).groupby(level='Ticker').agg(['mean', 'max'])
@@ -0,0 +1,106 @@
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+import aiohttp
+import numpy as np
+import pandas as pd
+
+from cache import CACHE_DIR, FileCache, cached_datareader
+
+# 네이버 차트 API (FinanceDataReader가 내부적으로 사용하는 것과 동일한 엔드포인트)
+CHART_URL = 'https://fchart.stock.naver.com/sise.nhn?symbol={code}&timeframe=day&count={count}&requestType=0'
+CHART_COUNT = 120           # 영업일 기준 조회 개수 (120일치 달력 기간을 충분히 덮음)
+MAX_CONCURRENCY = 80        # 동시 요청 수
+FALLBACK_WORKERS = 10       # fdr 재시도 스레드 수
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+ITEM_PATTERN = re.compile(r'<item data="([^"]*)"')
+
+chart_cache = FileCache(CACHE_DIR / 'chart')
+
+
+def frame_to_arrays(df: pd.DataFrame) -> dict:
+    """분석에 필요한 컬럼만 numpy 배열로 변환"""
+    # 국내 주가는 float32로 정확히 표현되므로 가격은 float32, 거래량은 int64 유지
+    ohlcv = {column: df[column].to_numpy(dtype=np.float32) for column in ('High', 'Low', 'Close')}
+    ohlcv['Volume'] = df['Volume'].to_numpy(dtype=np.int64)
+    return ohlcv
+
+
+def parse_chart(text: str, start: str) -> dict:
+    """차트 XML의 item(날짜|시가|고가|저가|종가|거래량)을 pandas 없이 바로 numpy 배열로 변환"""
+    items = ITEM_PATTERN.findall(text)
+    dates = np.empty(len(items), dtype=np.int64)
+    high = np.empty(len(items), dtype=np.float32)
+    low = np.empty(len(items), dtype=np.float32)
+    close = np.empty(len(items), dtype=np.float32)
+    volume = np.empty(len(items), dtype=np.int64)
+    for i, item in enumerate(items):
+        date, _, high[i], low[i], close[i], volume[i] = item.split('|')
+        dates[i] = date
+
+    # fdr.DataReader(code, start=...)와 같은 기간만 남김
+    keep = dates >= int(start.replace('-', ''))
+    return {'High': high[keep], 'Low': low[keep], 'Close': close[keep], 'Volume': volume[keep]}
+
+
+async def _fetch_chart(session, semaphore, code: str, start: str) -> dict:
+    async with semaphore:
+        async with session.get(CHART_URL.format(code=code, count=CHART_COUNT)) as response:
+            response.raise_for_status()
+            body = await response.read()
+    return parse_chart(body.decode('euc-kr', 'ignore'), start)
+
+
+async def _fetch_all(codes: list, start: str) -> list:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session:
+        tasks = [_fetch_chart(session, semaphore, code, start) for code in codes]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _fetch_fallback(code: str, start: str, end: str):
+    try:
+        return frame_to_arrays(cached_datareader(code, start=start, end=end))
+    except Exception:
+        return None
+
+
+def fetch_ohlcv_many(codes: list, start: str, end: str) -> dict:
+    """여러 종목의 일봉 배열을 비동기로 한 번에 조회 (캐시 우선, 실패 시 fdr로 재시도)"""
+    results = {}
+    missing = []
+    for code in codes:
+        ohlcv = chart_cache.get((code, start, end))
+        if ohlcv is None:
+            missing.append(code)
+        else:
+            results[code] = ohlcv
+
+    if not missing:
+        return results
+
+    fetched = asyncio.run(_fetch_all(missing, start))
+    failed = []
+    for code, ohlcv in zip(missing, fetched):
+        if isinstance(ohlcv, Exception):
+            failed.append(code)
+        else:
+            chart_cache.set((code, start, end), ohlcv)
+            results[code] = ohlcv
+
+    if not failed:
+        return results
+
+    # 네이버가 요청을 제한하는 경우 실패 종목이 많을 수 있으므로 fdr 재시도도 병렬로 처리
+    print(f"⚠️ 네이버 차트 조회 실패 {len(failed)}개 종목은 fdr로 다시 조회합니다.")
+    with ThreadPoolExecutor(max_workers=FALLBACK_WORKERS) as executor:
+        for code, ohlcv in zip(failed, executor.map(_fetch_fallback, failed, repeat(start), repeat(end))):
+            if ohlcv is not None:
+                results[code] = ohlcv
+
+    return results